@@ -47,6 +47,7 @@ class Resolver:
     _app_id: Optional[str]
     _deduplication_cache: Dict[Hashable, Future]
     _client: _Client
+    _tree: "Optional[Tree]"
 
     def __init__(
         self,
@@ -55,12 +56,17 @@ class Resolver:
         environment_name: Optional[str] = None,
         app_id: Optional[str] = None,
     ):
-        from rich.tree import Tree
-
-        from ._output import step_progress
+        from ._output import OutputManager
 
         self._local_uuid_to_future = {}
-        self._tree = Tree(step_progress("Creating objects..."), guide_style="gray50")
+        # The progress tree is only ever rendered through an output manager, so skip building it otherwise
+        self._tree = None
+        if OutputManager.get():
+            from rich.tree import Tree
+
+            from ._output import step_progress
+
+            self._tree = Tree(step_progress("Creating objects..."), guide_style="gray50")
         self._client = client
         self._app_id = app_id
         self._environment_name = environment_name
@@ -93,25 +99,30 @@ class Resolver:
                 self._local_uuid_to_future[obj.local_uuid] = fut
             return obj
 
-        deduplication_key: Optional[Hashable] = None
-        if obj._deduplication_key:
-            deduplication_key = await obj._deduplication_key()
-
         cached_future = self._local_uuid_to_future.get(obj.local_uuid)
 
-        if not cached_future and deduplication_key is not None:
-            # deduplication cache makes sure duplicate mounts are resolved only
-            # once, even if they are different instances - as long as they have
-            # the same content
-            cached_future = self._deduplication_cache.get(deduplication_key)
-            if cached_future:
-                hydrated_object = await cached_future
-                obj._hydrate(hydrated_object.object_id, self._client, hydrated_object._get_metadata())
-                return obj
-
         if not cached_future:
             # don't run any awaits within this if-block to prevent race conditions
             async def loader():
+                # The deduplication key is computed inside the task, so that loading the same
+                # instance several times (e.g. a mount shared by many functions) computes it only once
+                deduplication_key: Optional[Hashable] = None
+                if obj._deduplication_key:
+                    deduplication_key = await obj._deduplication_key()
+
+                if deduplication_key is not None:
+                    # deduplication cache makes sure duplicate mounts are resolved only
+                    # once, even if they are different instances - as long as they have
+                    # the same content
+                    deduplicated_future = self._deduplication_cache.get(deduplication_key)
+                    if deduplicated_future:
+                        hydrated_object = await deduplicated_future
+                        obj._hydrate(hydrated_object.object_id, self._client, hydrated_object._get_metadata())
+                        return obj
+                    current_task = asyncio.current_task()
+                    assert current_task is not None
+                    self._deduplication_cache[deduplication_key] = current_task
+
                 # Wait for all its dependencies
                 # TODO(erikbern): do we need existing_object_id for those?
                 await TaskContext.gather(*[self.load(dep) for dep in obj.deps()])
@@ -136,8 +147,6 @@ class Resolver:
 
             cached_future = asyncio.create_task(loader())
             self._local_uuid_to_future[obj.local_uuid] = cached_future
-            if deduplication_key is not None:
-                self._deduplication_cache[deduplication_key] = cached_future
         return await cached_future
 
     def objects(self) -> List["_Object"]:
@@ -157,7 +166,8 @@ class Resolver:
         # TODO(erikbern): get rid of this wrapper
         from ._output import OutputManager, step_completed
 
-        if output_mgr := OutputManager.get():
+        output_mgr = OutputManager.get()
+        if output_mgr and self._tree is not None:
             with output_mgr.make_live(self._tree):
                 yield
             self._tree.label = step_completed("Created objects.")
@@ -4,17 +4,18 @@ import re
 import traceback
 import warnings
 from types import TracebackType
-from typing import Any, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from rich.console import Console, RenderResult, group
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.text import Text
-from rich.traceback import PathHighlighter, Stack, Traceback, install
 
 from ._vendor.tblib import Traceback as TBLibTraceback
 from .exception import DeprecationError, PendingDeprecationError
 
+if TYPE_CHECKING:
+    from rich.traceback import Stack
+
 TBDictType = Dict[str, Any]
 LineCacheType = Dict[Tuple[str, str], str]
 
@@ -107,9 +108,12 @@ def traceback_contains_remote_call(tb: Optional[TracebackType]) -> bool:
 
 
 @group()
-def _render_stack(self, stack: Stack) -> RenderResult:
+def _render_stack(self, stack: "Stack") -> RenderResult:
     """Patched variant of rich.Traceback._render_stack that uses the line from the modal StackSummary,
     when the file isn't available to be read locally."""
+    # Defer import of rich's syntax highlighting, which is only needed by the CLI
+    from rich.syntax import Syntax
+    from rich.traceback import PathHighlighter
 
     path_highlighter = PathHighlighter()
     theme = self.theme
@@ -228,6 +232,8 @@ def _render_stack(self, stack: Stack) -> RenderResult:
 
 
 def setup_rich_traceback() -> None:
+    from rich.traceback import Traceback, install
+
     from_exception = Traceback.from_exception
 
     @functools.wraps(Traceback.from_exception)
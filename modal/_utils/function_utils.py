@@ -36,6 +36,10 @@ CLASS_PARAM_TYPE_MAP: Dict[Type, Tuple["api_pb2.ParameterType.ValueType", str]]
 }
 
 
+# Entrypoint mounts shared by all functions declared in the same module or file
+_entrypoint_mount_cache: Dict[Tuple[Any, ...], List[_Mount]] = {}
+
+
 class LocalFunctionError(InvalidError):
     """Raised if a function declared in a non-global scope is used in an impermissible way"""
 
@@ -280,12 +284,22 @@ class FunctionInfo:
         if self._type == FunctionInfoType.NOTEBOOK:
             # Don't auto-mount anything for notebooks.
             return []
+        if self.definition_type != api_pb2.Function.DEFINITION_TYPE_FILE:
+            return []
 
+        # All functions in a module share the same entrypoint mount, so only create it once
+        automount = config.get("automount")
+        cache_key = (self._type, self.module_name, self._file, automount)
+        if cache_key not in _entrypoint_mount_cache:
+            _entrypoint_mount_cache[cache_key] = self._create_entrypoint_mount(automount)
+        return list(_entrypoint_mount_cache[cache_key])
+
+    def _create_entrypoint_mount(self, automount: bool) -> List[_Mount]:
         # make sure the function's own entrypoint is included:
         if self._type == FunctionInfoType.PACKAGE:
-            if config.get("automount"):
+            if automount:
                 return [_Mount.from_local_python_packages(self.module_name)]
-            elif self.definition_type == api_pb2.Function.DEFINITION_TYPE_FILE:
+            else:
                 # mount only relevant file and __init__.py:s
                 return [
                     _Mount.from_local_dir(
@@ -295,7 +309,7 @@ class FunctionInfo:
                         condition=entrypoint_only_package_mount_condition(self._file),
                     )
                 ]
-        elif self.definition_type == api_pb2.Function.DEFINITION_TYPE_FILE:
+        else:
             remote_path = ROOT_DIR / Path(self._file).name
             if not _is_modal_path(remote_path):
                 return [
@@ -5,7 +5,7 @@ import typing
 import warnings
 from pathlib import PurePosixPath
 from textwrap import dedent
-from typing import Any, AsyncGenerator, Callable, ClassVar, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, AsyncGenerator, Callable, ClassVar, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
 
 import typing_extensions
 from google.protobuf.message import Message
@@ -47,6 +47,46 @@ from .volume import _Volume
 
 _default_image: _Image = _Image.debian_slim()
 
+_ENABLE_OUTPUT_WARNING = dedent(
+    """
+    Note that output will soon not be be printed with `app.run`.
+
+    If you want to print output, use `modal.enable_output()`:
+
+    ```python
+    with modal.enable_output():
+        with app.run():
+            ...
+    ```
+
+    If you don't want output, and you want to to suppress this warning,
+    use `app.run(..., show_progress=False)`.
+    """
+)
+
+_FUNCTION_NOT_GLOBAL_ERROR = dedent(
+    """
+    The `@app.function` decorator must apply to functions in global scope,
+    unless `serialize=True` is set.
+    If trying to apply additional decorators, they may need to use `functools.wraps`.
+    """
+)
+
+_FUNCTION_ON_METHOD_ERROR = dedent(
+    """
+    The `@app.function` decorator cannot be used on class methods.
+    Please use `@app.cls` with `@modal.method` instead. Example:
+
+    ```python
+    @app.cls()
+    class MyClass:
+        @modal.method()
+        def f(self, x):
+            ...
+    ```
+    """
+)
+
 
 class _LocalEntrypoint:
     _info: FunctionInfo
@@ -83,6 +123,27 @@ def check_sequence(items: typing.Sequence[typing.Any], item_type: typing.Type[ty
         raise InvalidError(error_msg)
 
 
+def _check_deprecated_function_args(interactive: bool, _experimental_boost: None) -> None:
+    # Shared by `@app.function` and `@app.cls`
+    if interactive:
+        deprecation_error(
+            (2024, 5, 1), "interactive=True has been deprecated. Set MODAL_INTERACTIVE_FUNCTIONS=1 instead."
+        )
+
+    if _experimental_boost is not None:
+        deprecation_warning((2024, 7, 23), "`_experimental_boost` is now always-on. This argument is no longer needed.")
+
+
+def _get_scheduler_placement(
+    region: Optional[Union[str, Sequence[str]]], scheduler_placement: Optional[SchedulerPlacement]
+) -> Optional[SchedulerPlacement]:
+    if region:
+        if scheduler_placement:
+            raise InvalidError("`region` and `_experimental_scheduler_placement` cannot be used together")
+        return SchedulerPlacement(region=region)
+    return scheduler_placement
+
+
 CLS_T = typing.TypeVar("CLS_T", bound=typing.Type[Any])
 
 
@@ -141,14 +202,17 @@ class _App:
     _running_app: Optional[RunningApp]  # Various app info
     _client: Optional[_Client]
 
+    # Resolved once so that `__setattr__` doesn't have to look up `__annotations__` on every write
+    _annotated_attrs: ClassVar[FrozenSet[str]] = frozenset(__annotations__)
+
     def __init__(
         self,
         name: Optional[str] = None,
         *,
         image: Optional[_Image] = None,  # default image for all functions (default is `modal.Image.debian_slim()`)
-        mounts: Sequence[_Mount] = [],  # default mounts for all functions
-        secrets: Sequence[_Secret] = [],  # default secrets for all functions
-        volumes: Dict[Union[str, PurePosixPath], _Volume] = {},  # default volumes for all functions
+        mounts: Sequence[_Mount] = (),  # default mounts for all functions
+        secrets: Sequence[_Secret] = (),  # default secrets for all functions
+        volumes: Optional[Dict[Union[str, PurePosixPath], _Volume]] = None,  # default volumes for all functions
     ) -> None:
         """Construct a new app, optionally with default image, mounts, secrets, or volumes.
 
@@ -166,6 +230,9 @@ class _App:
         self._name = name
         self._description = name
 
+        if volumes is None:
+            volumes = {}
+
         check_sequence(mounts, _Mount, "`mounts=` has to be a list or tuple of Mount objects")
         check_sequence(secrets, _Secret, "`secrets=` has to be a list or tuple of Secret objects")
         validate_volumes(volumes)
@@ -265,7 +332,7 @@ class _App:
         # TODO(erikbern): remove this method later
         # Note that only attributes defined in __annotations__ are set on the object itself,
         # everything else is registered on the indexed_objects
-        if tag in self.__annotations__:
+        if tag in _App._annotated_attrs:
             object.__setattr__(self, tag, obj)
         elif tag == "image":
             self._image = obj
@@ -347,21 +414,6 @@ class _App:
         objects. For backwards compatibility reasons, it returns the same app.
         """
 
-        enable_output_warning = """
-        Note that output will soon not be be printed with `app.run`.
-
-        If you want to print output, use `modal.enable_output()`:
-
-        ```python
-        with modal.enable_output():
-            with app.run():
-                ...
-        ```
-
-        If you don't want output, and you want to to suppress this warning,
-        use `app.run(..., show_progress=False)`.
-        """
-
         # See Github discussion here: https://github.com/modal-labs/modal-client/pull/2030#issuecomment-2237266186
 
         auto_enable_output = False
@@ -369,11 +421,11 @@ class _App:
         if "MODAL_DISABLE_APP_RUN_OUTPUT_WARNING" not in os.environ:
             if show_progress is None:
                 if OutputManager.get() is None:
-                    deprecation_warning((2024, 7, 18), dedent(enable_output_warning))
+                    deprecation_warning((2024, 7, 18), _ENABLE_OUTPUT_WARNING)
                     auto_enable_output = True
             elif show_progress is True:
                 if OutputManager.get() is None:
-                    deprecation_warning((2024, 7, 18), dedent(enable_output_warning))
+                    deprecation_warning((2024, 7, 18), _ENABLE_OUTPUT_WARNING)
                     auto_enable_output = True
                 else:
                     deprecation_warning((2024, 7, 18), "`show_progress=True` is deprecated and no longer needed.")
@@ -588,15 +640,7 @@ class _App:
         if _warn_parentheses_missing:
             raise InvalidError("Did you forget parentheses? Suggestion: `@app.function()`.")
 
-        if interactive:
-            deprecation_error(
-                (2024, 5, 1), "interactive=True has been deprecated. Set MODAL_INTERACTIVE_FUNCTIONS=1 instead."
-            )
-
-        if _experimental_boost is not None:
-            deprecation_warning(
-                (2024, 7, 23), "`_experimental_boost` is now always-on. This argument is no longer needed."
-            )
+        _check_deprecated_function_args(interactive, _experimental_boost)
 
         if image is None:
             image = self._get_default_image()
@@ -629,33 +673,10 @@ class _App:
                     raise InvalidError("interactive=True is not supported with web endpoint functions")
             else:
                 if not is_global_object(f.__qualname__) and not serialized:
-                    raise InvalidError(
-                        dedent(
-                            """
-                            The `@app.function` decorator must apply to functions in global scope,
-                            unless `serialize=True` is set.
-                            If trying to apply additional decorators, they may need to use `functools.wraps`.
-                            """
-                        )
-                    )
+                    raise InvalidError(_FUNCTION_NOT_GLOBAL_ERROR)
 
                 if not is_top_level_function(f) and is_global_object(f.__qualname__):
-                    raise InvalidError(
-                        dedent(
-                            """
-                            The `@app.function` decorator cannot be used on class methods.
-                            Please use `@app.cls` with `@modal.method` instead. Example:
-
-                            ```python
-                            @app.cls()
-                            class MyClass:
-                                @modal.method()
-                                def f(self, x):
-                                    ...
-                            ```
-                            """
-                        )
-                    )
+                    raise InvalidError(_FUNCTION_ON_METHOD_ERROR)
 
                 info = FunctionInfo(f, serialized=serialized, name_override=name)
                 webhook_config = None
@@ -672,11 +693,7 @@ class _App:
             if is_generator is None:
                 is_generator = inspect.isgeneratorfunction(raw_f) or inspect.isasyncgenfunction(raw_f)
 
-            scheduler_placement: Optional[SchedulerPlacement] = _experimental_scheduler_placement
-            if region:
-                if scheduler_placement:
-                    raise InvalidError("`region` and `_experimental_scheduler_placement` cannot be used together")
-                scheduler_placement = SchedulerPlacement(region=region)
+            scheduler_placement = _get_scheduler_placement(region, _experimental_scheduler_placement)
 
             function = _Function.from_args(
                 info,
@@ -767,15 +784,7 @@ class _App:
         if _warn_parentheses_missing:
             raise InvalidError("Did you forget parentheses? Suggestion: `@app.cls()`.")
 
-        if interactive:
-            deprecation_error(
-                (2024, 5, 1), "interactive=True has been deprecated. Set MODAL_INTERACTIVE_FUNCTIONS=1 instead."
-            )
-
-        if _experimental_boost is not None:
-            deprecation_warning(
-                (2024, 7, 23), "`_experimental_boost` is now always-on. This argument is no longer needed."
-            )
+        _check_deprecated_function_args(interactive, _experimental_boost)
 
         if image is None:
             image = self._get_default_image()
@@ -791,11 +800,7 @@ class _App:
 
             info = FunctionInfo(None, serialized=serialized, user_cls=user_cls)
 
-            scheduler_placement: Optional[SchedulerPlacement] = _experimental_scheduler_placement
-            if region:
-                if scheduler_placement:
-                    raise InvalidError("`region` and `_experimental_scheduler_placement` cannot be used together")
-                scheduler_placement = SchedulerPlacement(region=region)
+            scheduler_placement = _get_scheduler_placement(region, _experimental_scheduler_placement)
 
             batch_functions = _find_partial_methods_for_user_cls(user_cls, _PartialFunctionFlags.BATCHED)
             if batch_functions:
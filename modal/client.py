@@ -1,5 +1,6 @@
 # Copyright Modal Labs 2022
 import asyncio
+import os
 import platform
 import warnings
 from typing import AsyncIterator, Awaitable, Callable, ClassVar, Dict, Optional, Tuple
@@ -7,6 +8,7 @@ from typing import AsyncIterator, Awaitable, Callable, ClassVar, Dict, Optional,
 import grpclib.client
 from aiohttp import ClientConnectorError, ClientResponseError
 from google.protobuf import empty_pb2
+from google.protobuf.internal import api_implementation
 from grpclib import GRPCError, Status
 from synchronicity.async_wrap import asynccontextmanager
 
@@ -25,6 +27,21 @@ HEARTBEAT_TIMEOUT: float = HEARTBEAT_INTERVAL + 0.1
 CLIENT_CREATE_ATTEMPT_TIMEOUT: float = 4.0
 CLIENT_CREATE_TOTAL_TIMEOUT: float = 15.0
 
+_warned_pure_python_protobuf = False
+
+
+def _warn_if_pure_python_protobuf() -> None:
+    # Message construction and serialization are much slower with the pure-Python protobuf backend
+    global _warned_pure_python_protobuf
+    if _warned_pure_python_protobuf or api_implementation.Type() != "python":
+        return
+    _warned_pure_python_protobuf = True
+    if os.environ.get("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION") == "python":
+        cause = "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python is set"
+    else:
+        cause = "the installed protobuf build is pure-Python"
+    logger.warning(f"protobuf is using its pure-Python implementation ({cause}), which makes Modal calls slower")
+
 
 def _get_metadata(client_type: int, credentials: Optional[Tuple[str, str]], version: str) -> Dict[str, str]:
     # This implements a simplified version of platform.platform() that's still machine-readable
@@ -156,6 +173,9 @@ class _Client:
     async def _init(self):
         """Connect to server and retrieve version information; raise appropriate error for various failures."""
         logger.debug("Client: Starting")
+        if self.client_type == api_pb2.CLIENT_TYPE_CLIENT:
+            # Only local users can act on this, so keep it out of container logs
+            _warn_if_pure_python_protobuf()
         _check_config()
         try:
             req = empty_pb2.Empty()
@@ -473,7 +473,7 @@ class _Cls(_Object, type_prefix="cs"):
         cls = self.clone()
         cls._options = api_pb2.FunctionOptions(
             replace_secret_ids=bool(secrets),
-            secret_ids=[secret.object_id for secret in secrets],
+            secret_ids=list(dict.fromkeys(secret.object_id for secret in secrets)),
             resources=resources,
             retry_policy=retry_policy,
             concurrency_limit=concurrency_limit,
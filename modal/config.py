@@ -223,6 +223,9 @@ _SETTINGS = {
     "i6pn_enabled": _Setting(False, transform=_to_boolean),  # For internal/experimental use
 }
 
+# Environment variable names for each setting, e.g. MODAL_LOGS_TIMEOUT for "logs_timeout"
+_ENV_VAR_KEYS = {key: "MODAL_" + key.upper() for key in _SETTINGS}
+
 
 class Config:
     """Singleton that holds configuration used by Modal internally."""
@@ -241,9 +244,9 @@ class Config:
         if profile is None:
             profile = _profile
         s = _SETTINGS[key]
-        env_var_key = "MODAL_" + key.upper()
-        if use_env and env_var_key in os.environ:
-            return s.transform(os.environ[env_var_key])
+        env_value = os.environ.get(_ENV_VAR_KEYS[key]) if use_env else None
+        if env_value is not None:
+            return s.transform(env_value)
         elif profile in _user_config and key in _user_config[profile]:
             return s.transform(_user_config[profile][key])
         else:
@@ -255,7 +258,7 @@ class Config:
         # Does NOT write back to settings file etc.
         try:
             self.get(key)
-            os.environ["MODAL_" + key.upper()] = value
+            os.environ[_ENV_VAR_KEYS[key]] = value
         except KeyError:
             # Override env vars not available in config, e.g. NVIDIA_VISIBLE_DEVICES.
             # This is used for restoring env vars from a memory snapshot.
@@ -787,7 +787,7 @@ class _Function(typing.Generic[P, R], _Object, type_prefix="fu"):
                     module_name=info.module_name or "",
                     function_name=info.function_name,
                     mount_ids=loaded_mount_ids,
-                    secret_ids=[secret.object_id for secret in secrets],
+                    secret_ids=list(dict.fromkeys(secret.object_id for secret in secrets)),
                     image_id=(image.object_id if image else ""),
                     definition_type=info.definition_type,
                     function_serialized=function_serialized or b"",
@@ -381,7 +381,7 @@ class _Image(_Object, type_prefix="im"):
                 base_images=base_images_pb2s,
                 dockerfile_commands=dockerfile.commands,
                 context_files=context_file_pb2s,
-                secret_ids=[secret.object_id for secret in secrets],
+                secret_ids=list(dict.fromkeys(secret.object_id for secret in secrets)),
                 gpu=bool(gpu_config.type),  # Note: as of 2023-01-27, server still uses this
                 context_mount_id=(context_mount.object_id if context_mount else None),
                 gpu_config=gpu_config,  # Note: as of 2023-01-27, server ignores this
@@ -649,11 +649,21 @@ def _create_client_mount():
 create_client_mount = synchronize_api(_create_client_mount)
 
 
+# With `sync_entrypoint` (a development setting), the locally built client mount is one object shared by every app
+# and client in the process, so each resolver walks the client package files once rather than once per function.
+# Each resolver re-hydrates it in place, so concurrent runs against different clients may see each other's mount id.
+_local_client_mount: Optional[_Mount] = None
+
+
 def _get_client_mount():
     # TODO(erikbern): make this a static method on the Mount class
+    global _local_client_mount
     if config["sync_entrypoint"]:
-        return _create_client_mount()
+        if _local_client_mount is None:
+            _local_client_mount = _create_client_mount()
+        return _local_client_mount
     else:
+        # Looked up per function, so that a hydrated reference is never shared between clients
         return _Mount.from_name(client_mount_name(), namespace=api_pb2.DEPLOYMENT_NAMESPACE_GLOBAL)
 
 
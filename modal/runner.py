@@ -42,6 +42,23 @@ else:
 
 V = TypeVar("V")
 
+_default_app_description: Optional[str] = None
+
+
+def _get_default_app_description() -> str:
+    """Name the app after the entrypoint script; `__main__` doesn't change within a process."""
+    global _default_app_description
+    if _default_app_description is None:
+        import __main__
+
+        if "__file__" in dir(__main__):
+            _default_app_description = os.path.basename(__main__.__file__)
+        else:
+            # Interactive mode does not have __file__.
+            # https://docs.python.org/3/library/__main__.html#import-main
+            _default_app_description = __main__.__name__
+    return _default_app_description
+
 
 async def _heartbeat(client: _Client, app_id: str) -> None:
     request = api_pb2.AppHeartbeatRequest(app_id=app_id)
@@ -242,14 +259,7 @@ async def _run_app(
         )
 
     if app.description is None:
-        import __main__
-
-        if "__file__" in dir(__main__):
-            app.set_description(os.path.basename(__main__.__file__))
-        else:
-            # Interactive mode does not have __file__.
-            # https://docs.python.org/3/library/__main__.html#import-main
-            app.set_description(__main__.__name__)
+        app.set_description(_get_default_app_description())
 
     if client is None:
         client = await _Client.from_env()
@@ -261,7 +271,10 @@ async def _run_app(
         app_state=app_state,
         interactive=interactive,
     )
-    async with app._set_local_app(client, running_app), TaskContext(grace=config["logs_timeout"]) as tc:
+    # The grace period is there to let the logs loop drain on shutdown. Without output there is no logs loop,
+    # so don't hold up teardown on an in-flight heartbeat (same as `_deploy_app`).
+    grace = config["logs_timeout"] if OutputManager.get() else 0
+    async with app._set_local_app(client, running_app), TaskContext(grace=grace) as tc:
         # Start heartbeats loop to keep the client alive
         # we don't log heartbeat exceptions in detached mode
         # as losing the local connection will not affect the running app
@@ -120,7 +120,7 @@ class _Sandbox(_Object, type_prefix="sb"):
                 entrypoint_args=entrypoint_args,
                 image_id=image.object_id,
                 mount_ids=[mount.object_id for mount in mounts],
-                secret_ids=[secret.object_id for secret in secrets],
+                secret_ids=list(dict.fromkeys(secret.object_id for secret in secrets)),
                 timeout_secs=timeout,
                 workdir=workdir,
                 resources=convert_fn_config_to_resources_config(
@@ -30,9 +30,9 @@ class _Secret(_Object, type_prefix="st"):
 
     @staticmethod
     def from_dict(
-        env_dict: Dict[
-            str, Union[str, None]
-        ] = {},  # dict of entries to be inserted as environment variables in functions using the secret
+        env_dict: Optional[
+            Dict[str, Union[str, None]]
+        ] = None,  # dict of entries to be inserted as environment variables in functions using the secret
     ):
         """Create a secret from a str-str dictionary. Values can also be `None`, which is ignored.
 
@@ -43,14 +43,18 @@ class _Secret(_Object, type_prefix="st"):
             print(os.environ["FOO"])
         ```
         """
-        if not isinstance(env_dict, dict):
+        if env_dict is None:
+            env_dict = {}
+        elif not isinstance(env_dict, dict):
             raise InvalidError(ENV_DICT_WRONG_TYPE_ERR)
 
-        env_dict_filtered: Dict[str, str] = {k: v for k, v in env_dict.items() if v is not None}
-        if not all(isinstance(k, str) for k in env_dict_filtered.keys()):
-            raise InvalidError(ENV_DICT_WRONG_TYPE_ERR)
-        if not all(isinstance(v, str) for v in env_dict_filtered.values()):
-            raise InvalidError(ENV_DICT_WRONG_TYPE_ERR)
+        env_dict_filtered: Dict[str, str] = {}
+        for k, v in env_dict.items():
+            if v is None:
+                continue
+            if not isinstance(k, str) or not isinstance(v, str):
+                raise InvalidError(ENV_DICT_WRONG_TYPE_ERR)
+            env_dict_filtered[k] = v
 
         async def _load(self: _Secret, resolver: Resolver, existing_object_id: Optional[str]):
             if resolver.app_id is not None:
@@ -74,8 +78,12 @@ class _Secret(_Object, type_prefix="st"):
                 raise
             self._hydrate(resp.secret_id, resolver.client, None)
 
+        async def _deduplication_key():
+            # Identical anonymous secrets within an app are only created once
+            return (_Secret._type_prefix, "dict", frozenset(env_dict_filtered.items()))
+
         rep = f"Secret.from_dict([{', '.join(env_dict.keys())}])"
-        return _Secret._from_loader(_load, rep)
+        return _Secret._from_loader(_load, rep, deduplication_key=_deduplication_key)
 
     @staticmethod
     def from_local_environ(
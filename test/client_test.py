@@ -3,6 +3,7 @@ import platform
 import pytest
 import subprocess
 import sys
+from unittest import mock
 
 from google.protobuf.empty_pb2 import Empty
 
@@ -199,3 +200,26 @@ def test_import_modal_from_thread(supports_dir):
     # For example, in Python <3.10, creating loop-bound asyncio primitives in global scope would
     # trigger an exception if there is no event loop in the thread (and it's not the main thread)
     subprocess.check_call([sys.executable, supports_dir / "import_modal_from_thread.py"])
+
+
+def test_pure_python_protobuf_warned_once(monkeypatch):
+    monkeypatch.setattr("modal.client.api_implementation.Type", lambda: "python")
+    monkeypatch.setattr("modal.client._warned_pure_python_protobuf", False)
+    monkeypatch.setenv("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "python")
+    with mock.patch("modal.client.logger.warning") as warning:
+        modal.client._warn_if_pure_python_protobuf()
+        modal.client._warn_if_pure_python_protobuf()
+    warning.assert_called_once()
+    assert "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python" in warning.call_args[0][0]
+
+
+def test_pure_python_protobuf_not_warned_in_container(servicer, monkeypatch):
+    monkeypatch.setattr("modal.client.api_implementation.Type", lambda: "python")
+    monkeypatch.setattr("modal.client._warned_pure_python_protobuf", False)
+    with mock.patch("modal.client.logger.warning") as warning:
+        with Client(servicer.container_addr, api_pb2.CLIENT_TYPE_CONTAINER, ("ta-123", "task-secret")):
+            pass
+        warning.assert_not_called()
+        with Client(servicer.client_addr, api_pb2.CLIENT_TYPE_CLIENT, ("foo-id", "foo-secret")):
+            pass
+        warning.assert_called_once()
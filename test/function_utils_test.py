@@ -133,3 +133,10 @@ async def test_stream_function_call_data(servicer, client):
     assert 0.111 <= elapsed < 1.0
 
     assert await gen.__anext__() == "world"
+
+
+def test_entrypoint_mount_shared_within_module():
+    [mount_a] = FunctionInfo(hasarg).get_entrypoint_mount()
+    [mount_b] = FunctionInfo(noarg).get_entrypoint_mount()
+    assert mount_a is mount_b
+    assert FunctionInfo(hasarg, serialized=True).get_entrypoint_mount() == []
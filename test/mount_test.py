@@ -6,10 +6,10 @@ import pytest
 import sys
 from pathlib import Path
 
-from modal import App
+from modal import App, mount as mount_module
 from modal._utils.blob_utils import LARGE_FILE_LIMIT
 from modal.exception import ModuleNotMountable
-from modal.mount import Mount
+from modal.mount import Mount, _get_client_mount
 
 
 @pytest.mark.asyncio
@@ -160,3 +160,28 @@ def test_chained_entries(test_dir):
     m.update(b"A")
     assert files[0].sha256_hex == m.hexdigest()
     assert files[0].use_blob is False
+
+
+def test_client_mount_files_selected_once(servicer, client, monkeypatch):
+    monkeypatch.setenv("MODAL_SYNC_ENTRYPOINT", "1")
+    client_mount_entries = _get_client_mount()._entries
+    client_mount_walks = 0
+    original_select_files = mount_module._select_files
+
+    def select_files(entries):
+        nonlocal client_mount_walks
+        if entries is client_mount_entries:
+            client_mount_walks += 1
+        return original_select_files(entries)
+
+    monkeypatch.setattr(mount_module, "_select_files", select_files)
+
+    app = App()
+    app.function()(dummy)
+    app.function(name="other")(dummy)
+    app.function(name="another")(dummy)
+    with app.run(client=client):
+        pass
+
+    # Once for the deduplication key and once for the upload, regardless of the number of functions
+    assert client_mount_walks == 2
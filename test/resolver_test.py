@@ -54,3 +54,52 @@ async def test_multi_resolve_concurrent_loads_once(client):
     await asyncio.gather(resolver.load(obj), resolver.load(obj))
     assert 0.08 < time.monotonic() - t0 < 0.17
     assert load_count == 1
+
+
+@pytest.mark.asyncio
+async def test_multi_resolve_computes_deduplication_key_once(client):
+    resolver = Resolver(client, environment_name="", app_id=None)
+
+    key_count = 0
+
+    class _DumbObject(_Object, type_prefix="zz"):
+        pass
+
+    async def _load(self: _DumbObject, resolver: Resolver, existing_object_id: Optional[str]):
+        self._hydrate("zz-123", resolver.client, None)
+
+    async def _deduplication_key():
+        nonlocal key_count
+        key_count += 1
+        await asyncio.sleep(0.1)
+        return "dumb"
+
+    obj = _DumbObject._from_loader(_load, "DumbObject()", deduplication_key=_deduplication_key)
+    await asyncio.gather(resolver.load(obj), resolver.load(obj))
+    await resolver.load(obj)
+    assert key_count == 1
+
+
+@pytest.mark.asyncio
+async def test_deduplicated_objects_load_once(client):
+    resolver = Resolver(client, environment_name="", app_id=None)
+
+    load_count = 0
+
+    class _DumbObject(_Object, type_prefix="zz"):
+        pass
+
+    async def _load(self: _DumbObject, resolver: Resolver, existing_object_id: Optional[str]):
+        nonlocal load_count
+        load_count += 1
+        self._hydrate("zz-123", resolver.client, None)
+        await asyncio.sleep(0.1)
+
+    async def _deduplication_key():
+        return "dumb"
+
+    obj_a = _DumbObject._from_loader(_load, "DumbObject()", deduplication_key=_deduplication_key)
+    obj_b = _DumbObject._from_loader(_load, "DumbObject()", deduplication_key=_deduplication_key)
+    await asyncio.gather(resolver.load(obj_a), resolver.load(obj_b))
+    assert load_count == 1
+    assert obj_a.object_id == obj_b.object_id == "zz-123"
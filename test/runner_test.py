@@ -1,7 +1,11 @@
 # Copyright Modal Labs 2023
+import asyncio
 import pytest
+import time
 import typing
 
+from google.protobuf.empty_pb2 import Empty
+
 import modal
 from modal.client import Client
 from modal.exception import ExecutionError
@@ -83,3 +87,25 @@ def test_run_app_custom_env_with_refs(servicer, client, monkeypatch):
 
     secret_get_or_create_2 = ctx.pop_request("SecretGetOrCreate")
     assert secret_get_or_create_2.environment_name == "third"
+
+
+def test_run_app_teardown_does_not_wait_for_heartbeat(servicer, client, monkeypatch):
+    # Without an output manager there is no logs loop, so the logs grace period shouldn't apply
+    monkeypatch.setenv("MODAL_LOGS_TIMEOUT", "3")
+    heartbeat_started = False
+
+    async def slow_heartbeat(servicer, stream):
+        nonlocal heartbeat_started
+        await stream.recv_message()
+        heartbeat_started = True
+        await asyncio.sleep(5)
+        await stream.send_message(Empty())
+
+    dummy_app = modal.App()
+    with servicer.intercept() as ctx:
+        ctx.set_responder("AppHeartbeat", slow_heartbeat)
+        with run_app(dummy_app, client=client):
+            while not heartbeat_started:
+                time.sleep(0.01)
+            t0 = time.monotonic()
+        assert time.monotonic() - t0 < 1.5
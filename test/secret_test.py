@@ -23,6 +23,19 @@ def test_secret_from_dict(servicer, client):
         assert servicer.secrets["st-0"] == {"FOO": "hello, world"}
 
 
+def test_secret_from_dict_deduplication(servicer, client):
+    app = App()
+    secret_a = Secret.from_dict({"FOO": "hello, world"})
+    secret_b = Secret.from_dict({"FOO": "hello, world"})
+    secret_c = Secret.from_dict({"FOO": "bye"})
+    f = app.function(secrets=[secret_a, secret_b, secret_c])(dummy)
+    with app.run(client=client):
+        assert secret_a.object_id == secret_b.object_id
+        assert secret_a.object_id != secret_c.object_id
+        assert len(servicer.secrets) == 2
+        assert servicer.app_functions[f.object_id].secret_ids == [secret_a.object_id, secret_c.object_id]
+
+
 @skip_old_py("python-dotenv requires python3.8 or higher", (3, 8))
 def test_secret_from_dotenv(servicer, client):
     with tempfile.TemporaryDirectory() as tmpdirname: